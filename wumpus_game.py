@@ -3,109 +3,278 @@ Wumpus World – Game Engine
 Refactored for GUI integration. Import-friendly, no top-level game loop.
 """
 import random
-from enum import Enum
-
-
-class Direction(Enum):
-    UP = "up"
-    DOWN = "down"
-    LEFT = "left"
-    RIGHT = "right"
-
+from enum import IntEnum
+
+
+class Direction(IntEnum):
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+
+class GameState(IntEnum):
+    PLAYING = 0
+    WIN = 1
+    DEAD_WUMPUS = 2
+    DEAD_PIT = 3
+
+
+# Direction vectors, indexed by Direction --------------------------------------
+DIR_DELTA = (
+    (-1, 0),  # UP
+    (1, 0),   # DOWN
+    (0, -1),  # LEFT
+    (0, 1),   # RIGHT
+)
+
+# Cell codes stored in WumpusWorld.grid ---------------------------------------
+EMPTY = 0
+WUMPUS = ord("W")
+GOLD = ord("G")
+ARROW = ord("A")
+PIT = ord("P")
+
+# Percept bits returned by WumpusWorld.get_percept_mask -----------------------
+GLITTER = 1
+BREEZE = 2
+STENCH = 4
+_PERCEPT_BITS = ((GLITTER, "Glitter"), (BREEZE, "Breeze"), (STENCH, "Stench"))
+
+# Status message for every percept mask, built once
+_PERCEPT_MSG = {
+    mask: "  ".join(f"⚠️ {name}" for bit, name in _PERCEPT_BITS if mask & bit)
+    for mask in range((GLITTER | BREEZE | STENCH) + 1)
+}
 
-class GameState(Enum):
-    PLAYING = "playing"
-    WIN = "win"
-    DEAD_WUMPUS = "dead_wumpus"
-    DEAD_PIT = "dead_pit"
 
+def _cast_ray(grid, size, r, c, dr, dc):
+    """Walk from (r, c) along (dr, dc) over a flat grid until a wall or the Wumpus.
 
-# Direction vectors -----------------------------------------------------------
-DIR_DELTA = {
-    Direction.UP: (-1, 0),
-    Direction.DOWN: (1, 0),
-    Direction.LEFT: (0, -1),
-    Direction.RIGHT: (0, 1),
-}
+    Returns (trail, hit): the cells passed through, and whether the last one
+    holds the Wumpus.
+    """
+    trail = []
+    append = trail.append  # bound once; the loop below only touches locals
+    while True:
+        r, c = r + dr, c + dc
+        if not (0 <= r < size and 0 <= c < size):
+            return trail, False
+        append((r, c))
+        if grid[r * size + c] == WUMPUS:
+            return trail, True
 
 
 class WumpusWorld:
     """The world grid: places Wumpus, gold, pits, and arrows."""
 
+    __slots__ = (
+        "size", "num_pits", "grid", "wumpus_alive", "wumpus_pos",
+        "_neighbors", "_percept_maps", "_percept_cache", "_grid_version",
+        "pits_bb", "wumpus_bb", "gold_bb", "arrow_bb",
+        "_full_mask", "_not_left_col", "_not_right_col",
+    )
+
     def __init__(self, size=4, num_pits=3):
         self.size = size
         self.num_pits = num_pits
-        self.grid: list[list[str]] = []
+        self.grid = bytearray()  # flat, one cell code per byte, r * size + c
         self.wumpus_alive = True
         self.wumpus_pos: tuple[int, int] | None = None
+        self._neighbors: list[list[tuple[int, int]]] = []
+        self._percept_maps: tuple[bytearray, bytearray] | None = None
+        self._percept_cache: bytearray | None = None  # percept mask per cell
+        self._grid_version = 0  # bumped on every grid write
+        # One bitboard per entity type, bit r * size + c; kept in step with grid
+        self.pits_bb = 0
+        self.wumpus_bb = 0
+        self.gold_bb = 0
+        self.arrow_bb = 0
+        self._full_mask = 0
+        self._not_left_col = 0
+        self._not_right_col = 0
         self.reset()
 
     # --- setup ---------------------------------------------------------------
     def reset(self):
         size = self.size
-        self.grid = [["" for _ in range(size)] for _ in range(size)]
+        self.grid = bytearray(size * size)
         self.wumpus_alive = True
-        cells = [
-            (r, c) for r in range(size) for c in range(size) if (r, c) != (size - 1, 0)
+        self._invalidate()
+
+        # Adjacency table, indexed by r * size + c
+        self._neighbors = [[] for _ in range(size * size)]
+        for r in range(size):
+            for c in range(size):
+                for dr, dc in DIR_DELTA:
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < size and 0 <= nc < size:
+                        self._neighbors[r * size + c].append((nr, nc))
+
+        # Bitboard masks used to stop horizontal shifts wrapping across rows
+        self._full_mask = (1 << (size * size)) - 1
+        left_col = sum(1 << (r * size) for r in range(size))
+        self._not_left_col = self._full_mask & ~left_col
+        self._not_right_col = self._full_mask & ~(left_col << (size - 1))
+
+        # Draw only the flat indices we need: wumpus, gold, arrow, then the
+        # pits. Sampling from range() skips building a cell list; indices at
+        # or past the start cell shift up by one to leave it empty.
+        start_idx = (size - 1) * size
+        free = size * size - 1
+        picks = [
+            i + (i >= start_idx)
+            for i in random.sample(range(free), 3 + min(self.num_pits, free - 3))
         ]
-        random.shuffle(cells)
+        wi, gi, ai, *pits = picks
 
         # Place wumpus
-        wp = cells.pop()
-        self.grid[wp[0]][wp[1]] = "W"
-        self.wumpus_pos = wp
+        self.grid[wi] = WUMPUS
+        self.wumpus_bb = 1 << wi
+        self.wumpus_pos = divmod(wi, size)
 
         # Place gold
-        gp = cells.pop()
-        self.grid[gp[0]][gp[1]] = "G"
+        self.grid[gi] = GOLD
+        self.gold_bb = 1 << gi
 
         # Place arrow pickup
-        ap = cells.pop()
-        self.grid[ap[0]][ap[1]] = "A"
+        self.grid[ai] = ARROW
+        self.arrow_bb = 1 << ai
 
         # Place pits
-        for _ in range(min(self.num_pits, len(cells))):
-            pp = cells.pop()
-            self.grid[pp[0]][pp[1]] = "P"
+        self.pits_bb = 0
+        for pi in pits:
+            self.grid[pi] = PIT
+            self.pits_bb |= 1 << pi
 
     # --- queries -------------------------------------------------------------
     def get_neighbors(self, r, c):
-        neighbors = []
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                neighbors.append((nr, nc))
-        return neighbors
+        """In-bounds orthogonal neighbors of (r, c). Shared list; do not mutate."""
+        return self._neighbors[r * self.size + c]
 
-    def get_percepts(self, pos):
+    def _spread(self, bb):
+        """Cells orthogonally adjacent to any set bit of a bitboard."""
+        size = self.size
+        return (
+            (bb << size)
+            | (bb >> size)
+            | ((bb & self._not_right_col) << 1)
+            | ((bb & self._not_left_col) >> 1)
+        ) & self._full_mask
+
+    def breeze_bb(self):
+        """Bitboard of cells with a Breeze (next to a pit)."""
+        return self._spread(self.pits_bb)
+
+    def stench_bb(self):
+        """Bitboard of cells with a Stench (next to the Wumpus)."""
+        return self._spread(self.wumpus_bb)
+
+    def compute_percept_maps(self):
+        """Breeze and Stench for every cell as two flat bytearrays (1 = present).
+
+        Unpacked from the breeze/stench bitboards and cached until the grid
+        changes; treat the returned arrays as read-only.
+        """
+        if self._percept_maps is None:
+            n = self.size * self.size
+            breeze = self.breeze_bb()
+            stench = self.stench_bb()
+            self._percept_maps = (
+                bytearray((breeze >> i) & 1 for i in range(n)),
+                bytearray((stench >> i) & 1 for i in range(n)),
+            )
+        return self._percept_maps
+
+    def reachable_mask(self, start=None):
+        """Cells reachable from start without entering a pit or the live Wumpus.
+
+        Flood-fills with whole-board bitboard shifts, one step per
+        iteration. Returns an int bitmask with bit r * size + c set for each
+        reachable cell; start defaults to the agent's start cell.
+        """
+        size = self.size
+        r, c = start if start is not None else (size - 1, 0)
+        walkable = self._full_mask & ~(self.pits_bb | self.wumpus_bb)
+        reach = (1 << (r * size + c)) & walkable
+        while True:
+            grown = (reach | self._spread(reach)) & walkable
+            if grown == reach:
+                return reach
+            reach = grown
+
+    def compute_all_percepts(self):
+        """Percept bitmask for every cell as a flat bytearray.
+
+        Computed once per grid mutation rather than per query; treat the
+        result as read-only.
+        """
+        if self._percept_cache is None:
+            breeze, stench = self.compute_percept_maps()
+            self._percept_cache = bytearray(
+                GLITTER * (v == GOLD) + BREEZE * b + STENCH * s
+                for v, b, s in zip(self.grid, breeze, stench)
+            )
+        return self._percept_cache
+
+    def get_percept_mask(self, pos):
+        """Percepts at pos as a GLITTER | BREEZE | STENCH bitmask."""
         r, c = pos
-        percepts = []
-        cell = self.grid[r][c]
-        if cell == "G":
-            percepts.append("Glitter")
-        if any(self.grid[nr][nc] == "P" for nr, nc in self.get_neighbors(r, c)):
-            percepts.append("Breeze")
-        if any(self.grid[nr][nc] == "W" for nr, nc in self.get_neighbors(r, c)):
-            percepts.append("Stench")
-        return percepts
+        return self.compute_all_percepts()[r * self.size + c]
+
+    def get_percepts(self, pos):
+        mask = self.get_percept_mask(pos)
+        return [name for bit, name in _PERCEPT_BITS if mask & bit]
 
     def cell_at(self, r, c):
-        return self.grid[r][c]
+        """Cell code at (r, c): EMPTY, WUMPUS, GOLD, ARROW or PIT."""
+        return self.grid[r * self.size + c]
+
+    @property
+    def version(self) -> int:
+        """Grid write counter; views can key caches of derived data on it."""
+        return self._grid_version
+
+    # --- mutation ------------------------------------------------------------
+    def _invalidate(self):
+        """Record a grid write and drop everything derived from the grid."""
+        self._grid_version += 1
+        self._percept_maps = None
+        self._percept_cache = None
+
+    def clear_cell(self, r, c):
+        """Empty cell (r, c) and drop cached percept data."""
+        i = r * self.size + c
+        self.grid[i] = EMPTY
+        keep = ~(1 << i)
+        self.pits_bb &= keep
+        self.wumpus_bb &= keep
+        self.gold_bb &= keep
+        self.arrow_bb &= keep
+        self._invalidate()
 
 
 class Agent:
     """Player agent with facing direction, inventory, and scoring."""
 
+    __slots__ = (
+        "world", "_start_idx", "_pos_idx", "facing", "has_gold", "has_arrow",
+        "_explored", "explored_count", "state", "score", "message", "message_timer",
+        "arrow_trail", "arrow_anim_timer", "killed_wumpus_pos",
+    )
+
     START_POS_OFFSET = -1  # computed from world size
 
     def __init__(self, world: WumpusWorld):
         self.world = world
-        start = (world.size - 1, 0)
-        self.pos = start
+        self._start_idx = (world.size - 1) * world.size  # flat index of start
+        self._pos_idx = self._start_idx
         self.facing = Direction.UP
         self.has_gold = False
         self.has_arrow = False
-        self.explored: set[tuple[int, int]] = {start}
+        self._explored = bytearray(world.size * world.size)  # 1 = visited
+        self._explored[self._start_idx] = 1
+        self.explored_count = 1
         self.state = GameState.PLAYING
         self.score = 0
         self.message = ""
@@ -114,6 +283,21 @@ class Agent:
         self.arrow_anim_timer = 0
         self.killed_wumpus_pos: tuple[int, int] | None = None
 
+    @property
+    def pos(self) -> tuple[int, int]:
+        """Current (row, col), derived from the flat position index."""
+        return divmod(self._pos_idx, self.world.size)
+
+    @property
+    def explored(self) -> set[tuple[int, int]]:
+        """Visited cells as a set of (row, col). Built on demand; prefer is_explored."""
+        size = self.world.size
+        return {divmod(i, size) for i, v in enumerate(self._explored) if v}
+
+    def is_explored(self, r, c) -> bool:
+        """Whether (r, c) has been visited, read straight from the flat bitmap."""
+        return self._explored[r * self.world.size + c] == 1
+
     # --- helpers -------------------------------------------------------------
     def _set_message(self, msg: str, duration: int = 120):
         self.message = msg
@@ -133,26 +317,30 @@ class Agent:
             return False
 
         self.facing = direction
+        size = self.world.size
         dr, dc = DIR_DELTA[direction]
-        nr, nc = self.pos[0] + dr, self.pos[1] + dc
+        r, c = divmod(self._pos_idx, size)
+        nr, nc = r + dr, c + dc
 
-        if not (0 <= nr < self.world.size and 0 <= nc < self.world.size):
+        if not (0 <= nr < size and 0 <= nc < size):
             self._set_message("Can't move there!", 60)
             return False
 
-        self.pos = (nr, nc)
-        self.explored.add(self.pos)
+        self._pos_idx = nr * size + nc
+        if not self._explored[self._pos_idx]:
+            self._explored[self._pos_idx] = 1
+            self.explored_count += 1
         self.score -= 1
 
         # Check cell contents
         cell = self.world.cell_at(nr, nc)
-        percepts = self.world.get_percepts(self.pos)
+        percepts = self.world.get_percept_mask((nr, nc))
 
-        if cell == "W":
+        if cell == WUMPUS:
             if self.has_arrow:
                 # auto-defend: kill wumpus on contact if you have arrow
                 self.has_arrow = False
-                self.world.grid[nr][nc] = ""
+                self.world.clear_cell(nr, nc)
                 self.world.wumpus_alive = False
                 self.killed_wumpus_pos = (nr, nc)
                 self.score += 500
@@ -160,30 +348,29 @@ class Agent:
             else:
                 self.state = GameState.DEAD_WUMPUS
                 self._set_message("💀 Eaten by the Wumpus! GAME OVER", 999)
-        elif cell == "P":
+        elif cell == PIT:
             self.state = GameState.DEAD_PIT
             self._set_message("💀 Fell into a pit! GAME OVER", 999)
-        elif cell == "G":
+        elif cell == GOLD:
             self.has_gold = True
-            self.world.grid[nr][nc] = ""
+            self.world.clear_cell(nr, nc)
             self.score += 1000
             self._set_message("✨ You found the GOLD! Return to start!", 180)
-        elif cell == "A":
+        elif cell == ARROW:
             self.has_arrow = True
-            self.world.grid[nr][nc] = ""
+            self.world.clear_cell(nr, nc)
             self.score += 0
             self._set_message("🏹 Picked up an arrow!", 120)
         else:
             # percept messages
             if percepts:
-                self._set_message("  ".join(f"⚠️ {p}" for p in percepts), 90)
+                self._set_message(_PERCEPT_MSG[percepts], 90)
             else:
                 self.message = ""
                 self.message_timer = 0
 
         # Win condition: have gold and back at start
-        start = (self.world.size - 1, 0)
-        if self.has_gold and self.pos == start:
+        if self.has_gold and self._pos_idx == self._start_idx:
             self.state = GameState.WIN
             self.score += 1000
             self._set_message("🏆 YOU WIN! Escaped with the gold!", 999)
@@ -204,22 +391,14 @@ class Agent:
         r, c = self.pos
 
         # Build trail for animation
-        trail = []
-        hit = False
-        while True:
-            r, c = r + dr, c + dc
-            if not (0 <= r < self.world.size and 0 <= c < self.world.size):
-                break
-            trail.append((r, c))
-            if self.world.cell_at(r, c) == "W":
-                hit = True
-                break
+        trail, hit = _cast_ray(self.world.grid, self.world.size, r, c, dr, dc)
 
         self.arrow_trail = trail
         self.arrow_anim_timer = 30  # frames
 
         if hit:
-            self.world.grid[r][c] = ""
+            r, c = trail[-1]
+            self.world.clear_cell(r, c)
             self.world.wumpus_alive = False
             self.killed_wumpus_pos = (r, c)
             self.score += 500
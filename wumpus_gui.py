@@ -13,14 +13,41 @@ Controls:
 import sys
 import math
 import random
+import functools
 import pygame
 import asyncio
-from wumpus_game import WumpusWorld, Agent, Direction, GameState, DIR_DELTA
+from wumpus_game import (
+    WumpusWorld, Agent, Direction, GameState, DIR_DELTA, WUMPUS, GOLD, ARROW, PIT,
+)
 
 # ─── Constants ───────────────────────────────────────────────────────────────
 DEFAULT_WINDOW_W, DEFAULT_WINDOW_H = 1280, 720
 FPS = 60
+IDLE_FPS = 15  # help and end screens; must divide FPS
 PANEL_WIDTH_RATIO = 0.28  # Panel takes 28% of window width
+STONE_VARIANTS = 4  # pre-rendered floor tiles per cell size
+SPRITE_PHASES = 63  # cached animation frames per sprite, one loop
+SPRITE_PHASE_TICKS = 2  # ticks per cached frame; 63 * 2 ≈ one Wumpus breath
+TEXT_CACHE_SIZE = 512  # rendered strings kept before the oldest is evicted
+DIRTY_AREA_LIMIT = 0.25  # above this share of the window, present it whole
+OVERLAY_CACHE_SIZE = 8  # pre-filled translucent surfaces kept, least recently used dropped
+MSG_BG_CACHE_SIZE = 16  # message box backgrounds kept, by size
+CELL_SPRITES = {WUMPUS: "wumpus", GOLD: "gold", PIT: "pit", ARROW: "arrow"}
+ANIMATED_SPRITES = frozenset({"wumpus", "gold"})  # cell sprites that change per phase
+MOVE_KEYS = {
+    pygame.K_w: Direction.UP, pygame.K_UP: Direction.UP,
+    pygame.K_s: Direction.DOWN, pygame.K_DOWN: Direction.DOWN,
+    pygame.K_a: Direction.LEFT, pygame.K_LEFT: Direction.LEFT,
+    pygame.K_d: Direction.RIGHT, pygame.K_RIGHT: Direction.RIGHT,
+}
+_DEAD_STATES = frozenset({GameState.DEAD_WUMPUS, GameState.DEAD_PIT})
+# Events after which the window contents may be gone; these need pygame 2.0.1+
+_WINDOW_REDRAW_EVENTS = frozenset(
+    getattr(pygame, name) for name in ("WINDOWSHOWN", "WINDOWEXPOSED", "WINDOWRESTORED")
+    if hasattr(pygame, name))
+# Browsers already pause hidden tabs, and get_active() is not a dependable
+# visibility signal in the pygbag build, so only desktop skips hidden frames
+_SKIP_HIDDEN_FRAMES = sys.platform != "emscripten"
 
 # Colors - Cave theme
 COL_BG = (18, 18, 24)
@@ -66,11 +93,116 @@ COL_STALACTITE = (60, 55, 48)
 COL_TORCH_GLOW = (255, 180, 80)
 COL_BLOOD = (120, 20, 20)
 
+# Side-panel percept lines
+_PERCEPT_ICON = {"Stench": "💨", "Breeze": "🌀", "Glitter": "✨"}
+_PERCEPT_COL = {"Stench": COL_STENCH, "Breeze": COL_BREEZE, "Glitter": COL_GLITTER}
+
+# Help overlay lines as (text, font, colour); font names a WumpusGUI.font_*
+# attribute, and a None font is a blank spacer
+_HELP_LINES = [
+    ("🏰 Wumpus World – How to Play", "title", COL_TEXT_GOLD),
+    ("", None, None),
+    ("Movement:", "body", COL_TEXT),
+    ("  W / ↑  –  Move Up", "small", COL_TEXT_DIM),
+    ("  A / ←  –  Move Left", "small", COL_TEXT_DIM),
+    ("  S / ↓  –  Move Down", "small", COL_TEXT_DIM),
+    ("  D / →  –  Move Right", "small", COL_TEXT_DIM),
+    ("", None, None),
+    ("Actions:", "body", COL_TEXT),
+    ("  Enter / Space  –  Shoot arrow (in facing direction)", "small", COL_TEXT_DIM),
+    ("  R              –  Restart game", "small", COL_TEXT_DIM),
+    ("  H              –  Toggle this help", "small", COL_TEXT_DIM),
+    ("  F11            –  Toggle fullscreen", "small", COL_TEXT_DIM),
+    ("", None, None),
+    ("Symbols:", "body", COL_TEXT),
+    ("  👹 Wumpus – Deadly monster (kill with arrow)", "small", COL_WUMPUS),
+    ("  ✨ Gold – Collect and return to start to win", "small", COL_GOLD),
+    ("  🕳️ Pit – Instant death", "small", COL_TEXT_RED),
+    ("  🏹 Arrow – Pickup to shoot or auto-defend vs Wumpus", "small", COL_ARROW_ITEM),
+    ("", None, None),
+    ("Percepts (warning on adjacent cells):", "body", COL_TEXT),
+    ("  💨 Stench – Wumpus nearby!", "small", COL_STENCH),
+    ("  🌀 Breeze – Pit nearby!", "small", COL_BREEZE),
+    ("  ✨ Glitter – Gold here!", "small", COL_GLITTER),
+    ("", None, None),
+    ("Goal: Find the gold and return to start (bottom-left)!", "body", COL_TEXT_GREEN),
+    ("", None, None),
+    ("Press H to close", "small", COL_TEXT_DIM),
+]
+
+# Side-panel game status line
+_STATE_LABELS = {
+    GameState.PLAYING: ("🎮 Playing...", COL_TEXT_DIM),
+    GameState.WIN: ("🏆 YOU WIN!", COL_TEXT_GOLD),
+    GameState.DEAD_WUMPUS: ("💀 Dead - Wumpus", COL_TEXT_RED),
+    GameState.DEAD_PIT: ("💀 Dead - Pit", COL_TEXT_RED),
+}
+
+
+# ─── Background ──────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=4)
+def _cave_gradient(w, h):
+    """Radial cave gradient for a w×h window, cached per size.
+
+    Sampled on a 1/8-scale surface and smooth-scaled up; the falloff is so
+    gentle that the upscale is indistinguishable from per-pixel drawing.
+    Shared between callers — copy before drawing on it.
+    """
+    scale = 8
+    sw, sh = max(w // scale, 1), max(h // scale, 1)
+    small = pygame.Surface((sw, sh), 0, 32)
+    center_x, center_y = w // 2, h // 2
+    max_dist = math.sqrt(center_x**2 + center_y**2)
+    for sy in range(sh):
+        y = sy * scale + scale // 2
+        for sx in range(sw):
+            x = sx * scale + scale // 2
+            dist = math.sqrt((x - center_x)**2 + (y - center_y)**2)
+            t = min(dist / max_dist, 1.0)
+            r = int(25 * (1 - t) + 15 * t)
+            g = int(20 * (1 - t) + 12 * t)
+            b = int(15 * (1 - t) + 10 * t)
+            small.set_at((sx, sy), (r, g, b))
+    return pygame.transform.smoothscale(small, (w, h))
+
+
+@functools.lru_cache(maxsize=4)
+def _vignette(w, h):
+    """Edge-darkening overlay for a w×h window, cached per size.
+
+    Alpha steps up by one every couple of pixels inward, so each run of
+    rings sharing an alpha is drawn as a single thick border.
+    """
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    rings = min(w, h) // 3
+    i = 0
+    while i < rings:
+        alpha = min(int((i / (min(w, h) / 3)) * 120), 120)
+        end = i + 1
+        while end < rings and min(int((end / (min(w, h) / 3)) * 120), 120) == alpha:
+            end += 1
+        # The innermost band keeps the 3px line width of a single ring
+        width = end - i + (2 if end == rings else 0)
+        pygame.draw.rect(surf, (0, 0, 0, alpha), (i, i, w - 2*i, h - 2*i), width)
+        i = end
+    return surf
+
 
 # ─── Particle System ─────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
+def _dust_dot(size, alpha):
+    """Translucent dust dot of the given radius, shared by all particles."""
+    s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(s, (200, 200, 180, alpha), (size, size), size)
+    return s
+
+
 class Particle:
     """Floating dust particle for atmosphere."""
+    __slots__ = ("x", "y", "vx", "vy", "life", "max_life", "size")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -86,36 +218,116 @@ class Particle:
         self.life -= 1
         return self.life > 0
     
-    def draw(self, surface):
+    def blit_item(self):
+        """(surface, pos) pair for a batched blit, or None once invisible."""
         alpha = int(255 * (self.life / self.max_life) * 0.3)
         if alpha > 0:
-            s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (200, 200, 180, alpha), (self.size, self.size), self.size)
-            surface.blit(s, (int(self.x) - self.size, int(self.y) - self.size))
+            size = self.size
+            return _dust_dot(size, alpha), (int(self.x) - size, int(self.y) - size)
+        return None
+
+
+def _ring(outer, inner):
+    """The parts of outer not covered by inner, as up to four rects."""
+    inner = inner.clip(outer)
+    parts = [
+        pygame.Rect(outer.left, outer.top, outer.w, inner.top - outer.top),
+        pygame.Rect(outer.left, inner.bottom, outer.w, outer.bottom - inner.bottom),
+        pygame.Rect(outer.left, inner.top, inner.left - outer.left, inner.h),
+        pygame.Rect(inner.right, inner.top, outer.right - inner.right, inner.h),
+    ]
+    return [r for r in parts if r.w > 0 and r.h > 0]
+
+
+def _merge_rects(rects):
+    """Union overlapping rects until none of the results overlap."""
+    merged = []
+    for r in rects:
+        r = r.copy()
+        i = r.collidelist(merged)
+        while i != -1:
+            r.union_ip(merged.pop(i))
+            i = r.collidelist(merged)
+        merged.append(r)
+    return merged
+
+
+def _blit_batch(surface, seq):
+    """Blit a list of (source, dest) pairs in one call (fblits on pygame-ce)."""
+    if hasattr(surface, "fblits"):
+        surface.fblits(seq)
+    else:
+        surface.blits(seq, doreturn=False)
+
+
+@functools.lru_cache(maxsize=256)
+def _glow(radius, r, g, b, a):
+    """Translucent filled circle on a 2·radius square, cached per (radius, rgba)."""
+    s = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(s, (r, g, b, a), (radius, radius), radius)
+    return s
 
 
 # ─── Sprite Drawing Functions ────────────────────────────────────────────────
 
+# Sine table for the animations drawn every frame (fog, percept icons, torch).
+# A 1024-step table is off by at most ~0.006, well below the pixel rounding
+# these offsets go through; sprites rendered once into the frame cache keep
+# using math.sin.
+_SIN_STEPS = 1024
+_SIN = [math.sin(2 * math.pi * i / _SIN_STEPS) for i in range(_SIN_STEPS)]
+_SIN_SCALE = _SIN_STEPS / (2 * math.pi)
+
+
+def fsin(x):
+    return _SIN[int(x * _SIN_SCALE) & (_SIN_STEPS - 1)]
+
+
+def fcos(x):
+    return _SIN[(int(x * _SIN_SCALE) + _SIN_STEPS // 4) & (_SIN_STEPS - 1)]
+
+
+# Win-title colour per tick: one |sin| half-wave every 64 ticks (0.05 rad/tick
+# gave 62.8), rounded to steps of 4 so the title reuses 11 cached renders
+_WIN_GLOW_TICKS = 64
+_WIN_GLOW_COLORS = [tuple(min(255, c + g) for c in COL_WIN_GLOW) for g in range(41)]
+_WIN_GLOW = [_WIN_GLOW_COLORS[int(math.sin(math.pi * i / _WIN_GLOW_TICKS) * 40) & ~3]
+             for i in range(_WIN_GLOW_TICKS)]
+
+
+@functools.lru_cache(maxsize=8)
+def _stone_gradient(w, h):
+    """Vertical stone shading for a w×h tile: one 1px column, stretched sideways."""
+    column = pygame.Surface((1, h))
+    for i in range(h):
+        t = i / h
+        column.set_at((0, i), tuple(int(COL_STONE[j] * (0.9 + t * 0.2)) for j in range(3)))
+    return pygame.transform.scale(column, (w, h))
+
+
 def draw_stone_tile(surface, rect):
     """Draw enhanced stone brick floor tile with cracks and moss."""
     x, y, w, h = rect
     # Base stone with gradient
-    for i in range(h):
-        t = i / h
-        col = tuple(int(COL_STONE[j] * (0.9 + t * 0.2)) for j in range(3))
-        pygame.draw.line(surface, col, (x, y + i), (x + w, y + i))
+    surface.blit(_stone_gradient(w, h), (x, y))
     
     # Brick pattern
     brick_h = max(h // 4, 4)
     brick_w = max(w // 3, 6)
     for row in range(5):
         ry = y + row * brick_h
+        # Brick inset by 1px, clipped to the tile
+        by0 = max(ry + 1, y)
+        by1 = min(ry + brick_h - 1, y + h)
+        if by1 <= by0:
+            continue
         offset = brick_w // 2 if row % 2 else 0
         for col in range(-1, 5):
             bx = x + col * brick_w + offset
-            br = pygame.Rect(bx + 1, ry + 1, brick_w - 2, brick_h - 2)
-            br = br.clip(pygame.Rect(rect))
-            if br.w > 0 and br.h > 0:
+            bx0 = max(bx + 1, x)
+            bx1 = min(bx + brick_w - 1, x + w)
+            if bx1 > bx0:
+                br = (bx0, by0, bx1 - bx0, by1 - by0)
                 pygame.draw.rect(surface, COL_STONE_LIGHT, br)
                 pygame.draw.rect(surface, COL_STONE_DARK, br, 1)
     
@@ -135,12 +347,25 @@ def draw_fog_tile(surface, rect, tick):
     # Swirling fog
     for i in range(10):
         phase = tick * 0.02 + i * 0.6
-        fx = x + int((math.sin(phase) * 0.5 + 0.5) * w)
-        fy = y + int((math.cos(phase * 0.7) * 0.5 + 0.5) * h)
-        r = 4 + int(math.sin(tick * 0.03 + i) * 2)
-        fog_surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-        pygame.draw.circle(fog_surf, (*COL_FOG_PATTERN, 80), (r, r), r)
-        surface.blit(fog_surf, (fx - r, fy - r))
+        fx = x + int((fsin(phase) * 0.5 + 0.5) * w)
+        fy = y + int((fcos(phase * 0.7) * 0.5 + 0.5) * h)
+        r = 4 + int(fsin(tick * 0.03 + i) * 2)
+        surface.blit(_glow(r, *COL_FOG_PATTERN, 80), (fx - r, fy - r))
+
+
+# Facing-arrow triangle relative to its anchor, indexed by Direction like DIR_DELTA
+_ARROW_SHAPE = (
+    ((0, -6), (-5, 3), (5, 3)),    # UP
+    ((0, 6), (-5, -3), (5, -3)),   # DOWN
+    ((-6, 0), (3, -5), (3, 5)),    # LEFT
+    ((6, 0), (-3, -5), (-3, 5)),   # RIGHT
+)
+
+
+# One cycle per sprite loop, in radians per tick. The cached sprites below
+# animate at whole (half, for |sin|) multiples of it, so the last cached
+# frame runs smoothly into the first.
+_SPRITE_CYCLE = 2 * math.pi / (SPRITE_PHASES * SPRITE_PHASE_TICKS)
 
 
 def draw_player(surface, cx, cy, size, facing, tick):
@@ -148,14 +373,14 @@ def draw_player(surface, cx, cy, size, facing, tick):
     s = size
     
     # Walking bob animation
-    bob = int(math.sin(tick * 0.15) * 2)
+    bob = int(math.sin(tick * 3 * _SPRITE_CYCLE) * 2)
     cy += bob
     
     # Direction offsets
     dx, dy = DIR_DELTA[facing]
     
     # Legs
-    leg_offset = int(math.sin(tick * 0.2) * 3)
+    leg_offset = int(math.sin(tick * 4 * _SPRITE_CYCLE) * 3)
     pygame.draw.rect(surface, COL_PLAYER_TUNIC, 
                     (cx - s//6 + leg_offset, cy + s//6, s//8, s//3), border_radius=2)
     pygame.draw.rect(surface, COL_PLAYER_TUNIC, 
@@ -170,7 +395,7 @@ def draw_player(surface, cx, cy, size, facing, tick):
     pygame.draw.rect(surface, COL_PLAYER_OUTLINE, (cx - s//3, cy, s * 2//3, 3))
     
     # Arms
-    arm_angle = math.sin(tick * 0.2) * 0.3
+    arm_angle = math.sin(tick * 4 * _SPRITE_CYCLE) * 0.3
     # Left arm
     arm_x = cx - s//3 + int(math.cos(arm_angle) * s//4)
     arm_y = cy + int(math.sin(arm_angle) * s//4)
@@ -181,7 +406,7 @@ def draw_player(surface, cx, cy, size, facing, tick):
     pygame.draw.line(surface, COL_PLAYER_SKIN, (cx + s//3, cy - s//8), (arm_x2, arm_y2), 4)
     
     # Torch in hand
-    torch_glow = int(abs(math.sin(tick * 0.1)) * 20)
+    torch_glow = int(abs(math.sin(tick * 2 * _SPRITE_CYCLE)) * 20)
     torch_surf = pygame.Surface((s, s), pygame.SRCALPHA)
     pygame.draw.circle(torch_surf, (*COL_TORCH_GLOW, 100 + torch_glow), (s//2, s//2), s//3)
     surface.blit(torch_surf, (arm_x2 - s//2, arm_y2 - s//2))
@@ -206,17 +431,10 @@ def draw_player(surface, cx, cy, size, facing, tick):
     # Direction arrow indicator
     arrow_x = cx + dx * (s//2 + 6)
     arrow_y = cy + dy * (s//2 + 6)
-    arrow_bob = int(math.sin(tick * 0.1) * 2)
+    arrow_bob = int(math.sin(tick * 2 * _SPRITE_CYCLE) * 2)
     arrow_x += dx * arrow_bob
     arrow_y += dy * arrow_bob
-    if facing == Direction.UP:
-        pts = [(arrow_x, arrow_y - 6), (arrow_x - 5, arrow_y + 3), (arrow_x + 5, arrow_y + 3)]
-    elif facing == Direction.DOWN:
-        pts = [(arrow_x, arrow_y + 6), (arrow_x - 5, arrow_y - 3), (arrow_x + 5, arrow_y - 3)]
-    elif facing == Direction.LEFT:
-        pts = [(arrow_x - 6, arrow_y), (arrow_x + 3, arrow_y - 5), (arrow_x + 3, arrow_y + 5)]
-    else:
-        pts = [(arrow_x + 6, arrow_y), (arrow_x - 3, arrow_y - 5), (arrow_x - 3, arrow_y + 5)]
+    pts = [(arrow_x + x, arrow_y + y) for x, y in _ARROW_SHAPE[facing]]
     pygame.draw.polygon(surface, COL_ARROW_PROJ, pts)
 
 
@@ -225,11 +443,11 @@ def draw_wumpus(surface, cx, cy, size, tick):
     s = size * 3 // 4
     
     # Breathing animation
-    breath = int(math.sin(tick * 0.05) * 3)
+    breath = int(math.sin(tick * _SPRITE_CYCLE) * 3)
     s += breath
     
     # Red glow aura
-    glow_size = s + 10 + int(abs(math.sin(tick * 0.08)) * 5)
+    glow_size = s + 10 + int(abs(math.sin(tick * 1.5 * _SPRITE_CYCLE)) * 5)
     glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
     pygame.draw.circle(glow_surf, (*COL_WUMPUS_GLOW, 40), (glow_size, glow_size), glow_size)
     surface.blit(glow_surf, (cx - glow_size, cy - glow_size))
@@ -254,7 +472,7 @@ def draw_wumpus(surface, cx, cy, size, tick):
     pygame.draw.polygon(surface, COL_WUMPUS_DARK, horn_right)
     
     # Glowing eyes with pulse
-    eye_glow = int(abs(math.sin(tick * 0.1)) * 30)
+    eye_glow = int(abs(math.sin(tick * 2 * _SPRITE_CYCLE)) * 30)
     eye_size = s//6 + eye_glow // 10
     pygame.draw.circle(surface, COL_WUMPUS_EYE, (cx - s//4, cy - s//6), eye_size)
     pygame.draw.circle(surface, COL_WUMPUS_EYE, (cx + s//4, cy - s//6), eye_size)
@@ -321,16 +539,16 @@ def draw_gold(surface, cx, cy, size, tick):
     s = size // 3
     # Rotating light rays
     for i in range(6):
-        angle = tick * 0.05 + i * 1.047
-        ray_len = s + int(abs(math.sin(tick * 0.08 + i)) * s//2)
+        angle = tick * _SPRITE_CYCLE + i * 1.047
+        ray_len = s + int(abs(math.sin(tick * 1.5 * _SPRITE_CYCLE + i)) * s//2)
         ex = cx + int(math.cos(angle) * ray_len)
         ey = cy + int(math.sin(angle) * ray_len)
         pygame.draw.line(surface, COL_GOLD_SHINE, (cx, cy), (ex, ey), 2)
     
     # Coins
     for i, (ox, oy) in enumerate([(0, 0), (-s//2, s//4), (s//2, s//4)]):
-        glint = int(math.sin(tick * 0.08 + i) * 30)
-        col = tuple(min(255, c + glint) for c in COL_GOLD)
+        glint = int(math.sin(tick * 2 * _SPRITE_CYCLE + i) * 30)
+        col = tuple(max(0, min(255, c + glint)) for c in COL_GOLD)
         pygame.draw.ellipse(surface, col, (cx + ox - s//2, cy + oy - s//3, s, s * 2//3))
         pygame.draw.ellipse(surface, (200, 170, 0), (cx + ox - s//2, cy + oy - s//3, s, s * 2//3), 2)
 
@@ -364,41 +582,52 @@ def draw_arrow_item(surface, cx, cy, size):
     pygame.draw.line(surface, (200, 100, 60), (fx, fy), (fx + 6, fy - 3), 2)
 
 
+_tiny_font_cache: dict[int, pygame.font.Font] = {}
+
+
+def _tiny_font(size):
+    """Bold percept-letter font, opened once per point size."""
+    font = _tiny_font_cache.get(size)
+    if font is None:
+        font = _tiny_font_cache[size] = pygame.font.SysFont("segoeui", size, bold=True)
+    return font
+
+
+@functools.lru_cache(maxsize=16)
+def _percept_letter(size, letter, color):
+    """Percept-icon letter rendered once per (point size, letter, colour)."""
+    return _tiny_font(size).render(letter, True, color)
+
+
 def draw_percept_icon(surface, cx, cy, size, percept, tick):
     """Draw percept indicator icons with glow halos."""
     s = max(size // 5, 6)
     if percept == "Stench":
         # Glow halo
-        glow_surf = pygame.Surface((s * 3, s * 3), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*COL_STENCH, 60), (s * 3 // 2, s * 3 // 2), s)
-        surface.blit(glow_surf, (cx - s * 3 // 2, cy - s * 3 // 2))
+        surface.blit(_glow(s, *COL_STENCH, 60), (cx - s, cy - s))
         # Wavy lines
         for i in range(3):
-            wave = int(math.sin(tick * 0.08 + i * 1.5) * 3)
+            wave = int(fsin(tick * 0.08 + i * 1.5) * 3)
             pygame.draw.circle(surface, COL_STENCH, (cx + (i - 1) * (s // 2), cy + wave), 2)
-        font_tiny = pygame.font.SysFont("segoeui", max(s + 2, 10), bold=True)
-        txt = font_tiny.render("S", True, COL_STENCH)
+        txt = _percept_letter(max(s + 2, 10), "S", COL_STENCH)
         surface.blit(txt, (cx - txt.get_width() // 2, cy - txt.get_height() // 2))
     elif percept == "Breeze":
         # Glow halo
-        glow_surf = pygame.Surface((s * 3, s * 3), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*COL_BREEZE, 60), (s * 3 // 2, s * 3 // 2), s)
-        surface.blit(glow_surf, (cx - s * 3 // 2, cy - s * 3 // 2))
+        surface.blit(_glow(s, *COL_BREEZE, 60), (cx - s, cy - s))
         # Swirl
         for i in range(4):
             angle = tick * 0.06 + i * 1.57
-            bx = cx + int(math.cos(angle) * s)
-            by = cy + int(math.sin(angle) * s)
+            bx = cx + int(fcos(angle) * s)
+            by = cy + int(fsin(angle) * s)
             pygame.draw.circle(surface, COL_BREEZE, (bx, by), 2)
-        font_tiny = pygame.font.SysFont("segoeui", max(s + 2, 10), bold=True)
-        txt = font_tiny.render("B", True, COL_BREEZE)
+        txt = _percept_letter(max(s + 2, 10), "B", COL_BREEZE)
         surface.blit(txt, (cx - txt.get_width() // 2, cy - txt.get_height() // 2))
     elif percept == "Glitter":
         # Sparkle
         for i in range(5):
             angle = tick * 0.1 + i * 1.26
-            gx = cx + int(math.cos(angle) * s)
-            gy = cy + int(math.sin(angle) * s)
+            gx = cx + int(fcos(angle) * s)
+            gy = cy + int(fsin(angle) * s)
             pygame.draw.circle(surface, COL_GLITTER, (gx, gy), 3)
 
 
@@ -430,6 +659,18 @@ class WumpusGUI:
         self.font_large = pygame.font.SysFont("segoeui", 36, bold=True)
         self.font_msg = pygame.font.SysFont("segoeui", 18, bold=True)
 
+        # Help text does not depend on the window; render it once with its
+        # y offsets, leaving only the centring to the overlay
+        self._help_lines = []
+        y = 60
+        for text, font, color in _HELP_LINES:
+            if font is None:
+                y += 8
+                continue
+            surf = getattr(self, "font_" + font).render(text, True, color).convert_alpha()
+            self._help_lines.append((surf, surf.get_width(), y))
+            y += surf.get_height() + 4
+
         # Game state
         self.world_size = 4
         self.num_pits = 3
@@ -444,28 +685,47 @@ class WumpusGUI:
         self.btn_help = pygame.Rect(0, 0, 0, 0)
         self.slider_rect = pygame.Rect(0, 0, 0, 0)
         self.dragging_slider = False
+        self._mouse_pos = (0, 0)  # sampled once per frame in draw()
 
         # Background and particles
         self.bg_surface = None
         self.bg_needs_update = True
         self.particles = []
 
+        # Tile caches: stone variants per cell size, and one fog tile per frame
+        self._stone_cache: dict[int, list[pygame.Surface]] = {}
+        self._fog_surf = None
+        self._fog_key = None
+        self._sprite_cache: dict[tuple, tuple[pygame.Surface, tuple[int, int]]] = {}
+        self._grid_layer_key = None
+        self._grid_layer_cache = None
+        # Translucent full-fill surfaces: scratch ones refilled per use (the
+        # fading gold flash), overlays filled once per (size, rgba)
+        self._scratch_alpha: dict[tuple[int, int], pygame.Surface] = {}
+        self._overlay_cache: dict[tuple[tuple[int, int], tuple], pygame.Surface] = {}
+        self._msg_bg_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self._help_surface = None
+        self._help_size = None
+        # Rendered strings keyed by (font, text, colour); fonts never change size
+        self._text_cache: dict[tuple[int, str, tuple], tuple[pygame.Surface, int, int]] = {}
+        self._prewarm_text()
+
+        # Dirty-rect redraw: the panel is kept on its own layer and only
+        # rebuilt when what it shows changes; everything else that moved last
+        # frame is listed in _dirty_rects and restored from bg_surface.
+        self._panel_surf = None
+        self._panel_chrome_cache: dict[int, pygame.Surface] = {}  # by percept-line count
+        self._button_cache: dict[tuple, pygame.Surface] = {}  # by (size, label, colour)
+        self._panel_key = None
+        self._dirty_rects: list[pygame.Rect] = []
+        self._full_redraw = True
+
     def _create_bg(self):
         """Create a cave-themed parallax background."""
         w, h = self.screen.get_size()
-        surf = pygame.Surface((w, h))
-        
-        # Layer 1: Deep cave radial gradient
-        center_x, center_y = w // 2, h // 2
-        max_dist = math.sqrt(center_x**2 + center_y**2)
-        for y in range(h):
-            for x in range(0, w, 4):
-                dist = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                t = min(dist / max_dist, 1.0)
-                r = int(25 * (1 - t) + 15 * t)
-                g = int(20 * (1 - t) + 12 * t)
-                b = int(15 * (1 - t) + 10 * t)
-                pygame.draw.line(surf, (r, g, b), (x, y), (x + 3, y))
+
+        # Layer 1: Deep cave radial gradient (convert() also copies it)
+        surf = _cave_gradient(w, h).convert()
         
         # Layer 2: Stalactites at top
         for i in range(8):
@@ -498,11 +758,7 @@ class WumpusGUI:
             pygame.draw.polygon(surf, COL_CAVE_DEEP, points, 2)
         
         # Vignette overlay
-        vignette = pygame.Surface((w, h), pygame.SRCALPHA)
-        for i in range(min(w, h) // 3):
-            alpha = int((i / (min(w, h) / 3)) * 120)
-            pygame.draw.rect(vignette, (0, 0, 0, min(alpha, 120)), (i, i, w - 2*i, h - 2*i), 3)
-        surf.blit(vignette, (0, 0))
+        surf.blit(_vignette(w, h), (0, 0))
         
         return surf
 
@@ -514,6 +770,218 @@ class WumpusGUI:
         else:
             self.screen = pygame.display.set_mode((DEFAULT_WINDOW_W, DEFAULT_WINDOW_H), pygame.RESIZABLE)
         self.bg_needs_update = True
+        self._flush_render_caches()
+
+    def _flush_render_caches(self):
+        """Drop pre-rendered tiles and sprites; they are rebuilt lazily at the new cell size."""
+        self._stone_cache.clear()
+        self._fog_surf = None
+        self._fog_key = None
+        self._sprite_cache.clear()
+        self._grid_layer_key = None
+        self._grid_layer_cache = None
+        self._scratch_alpha.clear()
+        self._overlay_cache.clear()
+        self._msg_bg_cache.clear()
+        self._help_surface = None
+        self._panel_chrome_cache.clear()
+        self._button_cache.clear()
+        self._panel_surf = None
+        self._panel_key = None
+        self._full_redraw = True
+
+    def _scratch(self, size):
+        """Reusable SRCALPHA surface of the given (w, h).
+
+        Holds whatever the previous user left in it; callers fill it
+        completely before blitting.
+        """
+        surf = self._scratch_alpha.get(size)
+        if surf is None:
+            surf = self._scratch_alpha[size] = pygame.Surface(size, pygame.SRCALPHA)
+        return surf
+
+    def _prewarm_text(self):
+        """Render the fixed emoji strings up front.
+
+        Emoji go through SDL_ttf's slow colour-glyph path; warming them here
+        keeps the first win, death or percept from stalling its frame.
+        """
+        for label, col in _STATE_LABELS.values():
+            self._text(self.font_body, label, col)
+        for p, icon in _PERCEPT_ICON.items():
+            self._text(self.font_small, f"{icon} {p}", _PERCEPT_COL[p])
+        for item in ("Gold", "Arrow"):
+            self._text(self.font_small, f"✅ {item}", COL_TEXT_GREEN)
+            self._text(self.font_small, f"❌ {item}", COL_TEXT_DIM)
+        for color in set(_WIN_GLOW):
+            self._text(self.font_large, "🏆 YOU WIN! 🏆", color)
+
+    def _overlay(self, size, rgba):
+        """Surface of the given (w, h) filled with rgba, filled once and reused."""
+        key = (size, rgba)
+        surf = self._overlay_cache.pop(key, None)
+        if surf is None:
+            if len(self._overlay_cache) >= OVERLAY_CACHE_SIZE:
+                del self._overlay_cache[next(iter(self._overlay_cache))]
+            surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            surf.fill(rgba)
+        self._overlay_cache[key] = surf
+        return surf
+
+    def _msg_bg(self, size):
+        """Message box background with its border baked in, kept per (w, h)."""
+        surf = self._msg_bg_cache.pop(size, None)
+        if surf is None:
+            if len(self._msg_bg_cache) >= MSG_BG_CACHE_SIZE:
+                del self._msg_bg_cache[next(iter(self._msg_bg_cache))]
+            surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            surf.fill(COL_MSG_BG)
+            pygame.draw.rect(surf, COL_GRID_LINE, surf.get_rect(), 1, border_radius=4)
+        self._msg_bg_cache[size] = surf
+        return surf
+
+    def _text_sized(self, font, text, color):
+        """Render text once per (font, text, colour); returns (surface, w, h)."""
+        key = (id(font), text, tuple(color))
+        entry = self._text_cache.get(key)
+        if entry is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = font.render(text, True, color).convert_alpha()
+            entry = self._text_cache[key] = (surf, *surf.get_size())
+        return entry
+
+    def _text(self, font, text, color):
+        """Cached rendered text surface; see _text_sized."""
+        return self._text_sized(font, text, color)[0]
+
+    def _blit_centered(self, font, text, color, y):
+        """Blit cached text horizontally centred in the window at height y."""
+        surf, tw, _ = self._text_sized(font, text, color)
+        self.screen.blit(surf, (self.window_size[0] // 2 - tw // 2, y))
+
+    def _sprite(self, name, size, phase=0, facing=None):
+        """Cached sprite frame as (surface, offset of its top-left from the center).
+
+        Each frame is drawn once with the regular draw_* function at
+        tick = phase * SPRITE_PHASE_TICKS, then cropped to its visible bounds.
+        """
+        key = (name, size, phase, facing)
+        entry = self._sprite_cache.get(key)
+        if entry is None:
+            half = size * 2
+            canvas = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            tick = phase * SPRITE_PHASE_TICKS
+            if name == "player":
+                draw_player(canvas, half, half, size, facing, tick)
+            elif name == "wumpus":
+                draw_wumpus(canvas, half, half, size, tick)
+            elif name == "dead_wumpus":
+                draw_dead_wumpus(canvas, half, half, size, tick)
+            elif name == "gold":
+                draw_gold(canvas, half, half, size, tick)
+            elif name == "pit":
+                draw_pit(canvas, half, half, size)
+            elif name == "arrow":
+                draw_arrow_item(canvas, half, half, size)
+            bounds = canvas.get_bounding_rect()
+            entry = (canvas.subsurface(bounds).copy(), (bounds.x - half, bounds.y - half))
+            self._sprite_cache[key] = entry
+        return entry
+
+    def _blit_sprite(self, name, cx, cy, size, phase=0, facing=None):
+        return self._blit_sprite_on(self.screen, name, cx, cy, size, phase, facing)
+
+    def _blit_sprite_on(self, surface, name, cx, cy, size, phase=0, facing=None):
+        surf, (dx, dy) = self._sprite(name, size, phase, facing)
+        return surface.blit(surf, (cx + dx, cy + dy))
+
+    def _stone_tiles(self, cs):
+        """Stone floor variants for cell size cs, rendered once."""
+        tiles = self._stone_cache.get(cs)
+        if tiles is None:
+            tiles = []
+            for _ in range(STONE_VARIANTS):
+                tile = pygame.Surface((cs, cs))
+                draw_stone_tile(tile, (0, 0, cs, cs))
+                tiles.append(tile)
+            self._stone_cache[cs] = tiles
+        return tiles
+
+    def _grid_layer(self, cs):
+        """Explored floor with everything on it that does not animate.
+
+        Returns (layer, fog_cells, live): the grid-sized layer, the offsets of
+        unexplored cells, and (x, y, sprite, percepts, dead_wumpus) for every
+        explored cell that still needs drawing each frame. Rebuilt only when
+        the board or the explored set changes.
+        """
+        key = (cs, self.world.version, self.agent.explored_count, self.agent.killed_wumpus_pos)
+        if self._grid_layer_key == key:
+            return self._grid_layer_cache
+        n = self.world.size
+        layer = pygame.Surface((cs * n, cs * n))
+        stone = self._stone_tiles(cs)
+        icon_size = cs * 2 // 3
+        fog_cells = []
+        explored = []
+        for r in range(n):
+            for c in range(n):
+                x, y = c * cs, r * cs
+                if self.agent.is_explored(r, c):
+                    layer.blit(stone[(r * 7 + c * 3) % STONE_VARIANTS], (x, y))
+                    pygame.draw.rect(layer, COL_EXPLORED_BORDER, (x, y, cs, cs), 1)
+                    explored.append((r, c, x, y))
+                else:
+                    fog_cells.append((x, y))
+
+        live = []
+        for r, c, x, y in explored:
+            name = CELL_SPRITES.get(self.world.cell_at(r, c))
+            percepts = self.world.get_percepts((r, c))
+            dead = self.agent.killed_wumpus_pos == (r, c)
+            # Still sprites that stay inside their cell are baked in; a dead
+            # wumpus is drawn over percept icons, so it only bakes without any
+            if name and name not in ANIMATED_SPRITES and self._sprite_fits(name, icon_size, cs):
+                self._blit_sprite_on(layer, name, x + cs // 2, y + cs // 2, icon_size)
+                name = None
+            if dead and not percepts and self._sprite_fits("dead_wumpus", icon_size, cs):
+                self._blit_sprite_on(layer, "dead_wumpus", x + cs // 2, y + cs // 2, icon_size)
+                dead = False
+            if name or percepts or dead:
+                live.append((x, y, name, percepts, dead))
+
+        self._grid_layer_key = key
+        self._grid_layer_cache = (layer, fog_cells, live)
+        return self._grid_layer_cache
+
+    def _sprite_fits(self, name, size, cs):
+        """Whether the sprite, centred in a cs-sized cell, stays inside it."""
+        surf, (dx, dy) = self._sprite(name, size)
+        w, h = surf.get_size()
+        half = cs // 2
+        return -dx <= half and -dy <= half and dx + w <= cs - half and dy + h <= cs - half
+
+    def _fog_tile(self, cs):
+        """Fog tile for the current frame.
+
+        Fog looks the same in every cell, so it is drawn once per frame and
+        blitted for each unexplored cell.
+        """
+        key = (cs, self.anim_tick)
+        if self._fog_key != key:
+            if self._fog_surf is None or self._fog_surf.get_width() != cs:
+                self._fog_surf = pygame.Surface((cs, cs))
+            draw_fog_tile(self._fog_surf, (0, 0, cs, cs), self.anim_tick)
+            pygame.draw.rect(self._fog_surf, COL_GRID_LINE, (0, 0, cs, cs), 1)
+            self._fog_key = key
+        return self._fog_surf
+
+    @property
+    def anim_tick(self):
+        """tick_count rounded down to even: live animations step at 30 Hz, same speed."""
+        return self.tick_count & ~1
 
     @property
     def window_size(self):
@@ -549,6 +1017,7 @@ class WumpusGUI:
         self.screen_shake = 0
         self.gold_flash = 0
         self.particles = []
+        self._flush_render_caches()
 
     # ─── Grid Calculations ──────────────────────────────────────────────
     @property
@@ -564,49 +1033,98 @@ class WumpusGUI:
         oy = 10 + (self.grid_area_h - total_h) // 2
         return ox, oy
 
+    def grid_bounds(self):
+        cs = self.cell_size
+        ox, oy = self.grid_origin()
+        return pygame.Rect(ox, oy, cs * self.world.size, cs * self.world.size)
+
     def cell_rect(self, r, c):
         ox, oy = self.grid_origin()
         cs = self.cell_size
         return pygame.Rect(ox + c * cs, oy + r * cs, cs, cs)
 
     # ─── Drawing ─────────────────────────────────────────────────────────
+    def _update_particles(self):
+        """Advance the dust by one frame: maybe spawn a mote, move and fade the rest."""
+        if random.random() < 0.3:
+            w, h = self.window_size
+            self.particles.append(Particle(random.randint(0, w), random.randint(0, h)))
+        self.particles = [p for p in self.particles if p.update()]
+
     def draw(self):
+        self._mouse_pos = pygame.mouse.get_pos()
+
         # Update background if needed
         if self.bg_needs_update or self.bg_surface is None:
             self.bg_surface = self._create_bg()
             self.bg_needs_update = False
+            self._full_redraw = True
         
         # Shake offset
         sx, sy = 0, 0
-        if self.screen_shake > 0:
+        shaking = self.screen_shake > 0
+        if shaking:
             sx = random.randint(-3, 3)
             sy = random.randint(-3, 3)
-            self.screen_shake -= 1
 
-        self.screen.blit(self.bg_surface, (sx, sy))
-        
-        # Spawn particles randomly
-        if random.random() < 0.3:
-            w, h = self.window_size
-            self.particles.append(Particle(random.randint(0, w), random.randint(0, h)))
-        
-        # Update and draw particles
-        self.particles = [p for p in self.particles if p.update()]
-        for p in self.particles:
-            p.draw(self.screen)
+        # Overlays cover the whole window, so those frames (and the one
+        # after them) are redrawn and presented in full.
+        overlay = self.gold_flash > 0 or self.agent.state != GameState.PLAYING or self.show_help
+        panel_key = self._panel_state()
+        full = self._full_redraw or shaking or overlay or panel_key != self._panel_key
+        prev_rects = self._dirty_rects
+        w, h = self.window_size
+        panel_rect = pygame.Rect(self.panel_x, 0, self.panel_w, h)
+
+        dots = [item for item in map(Particle.blit_item, self.particles) if item]
+        rects = [pygame.Rect(pos, surf.get_size()) for surf, pos in dots]
+
+        if full:
+            self.screen.blit(self.bg_surface, (sx, sy))
+        else:
+            # The panel layer goes back over everything touched inside the
+            # panel, including any grid overhang that reaches that far. Its
+            # antialiased text must land on clean background exactly once, so
+            # those areas are merged until disjoint and restored as a whole.
+            reach = self.cell_size
+            overhang = self.grid_bounds().inflate(reach * 2, reach * 2).clip(panel_rect)
+            if overhang.w and overhang.h:
+                rects.append(overhang)
+            panel_areas = _merge_rects(
+                [r.clip(panel_rect) for r in prev_rects + rects if r.colliderect(panel_rect)])
+            self.screen.blits([(self.bg_surface, r, r) for r in prev_rects + rects + panel_areas],
+                              doreturn=False)
+
+        _blit_batch(self.screen, dots)
         
-        self._draw_grid(sx, sy)
-        self._draw_panel()
-        self._draw_message()
+        grid_rect, spill = self._draw_grid(sx, sy)
+        rects += _ring(spill, grid_rect)
+
+        if panel_key != self._panel_key or self._panel_surf is None:
+            if self._panel_surf is None:
+                self._panel_surf = pygame.Surface(self.window_size, pygame.SRCALPHA)
+            else:
+                self._panel_surf.fill((0, 0, 0, 0), panel_rect)
+            # Chrome goes onto cleared pixels, so this blit is a straight copy
+            self._panel_surf.blit(self._panel_chrome(), panel_rect, panel_rect)
+            self._draw_panel(self._panel_surf)
+            self._panel_key = panel_key
+        if full:
+            self.screen.blit(self._panel_surf, panel_rect, panel_rect)
+        else:
+            self.screen.blits([(self._panel_surf, r, r) for r in panel_areas], doreturn=False)
+
+        msg_rect = self._draw_message()
+        if msg_rect:
+            rects.append(msg_rect)
 
         if self.gold_flash > 0:
-            flash_surf = pygame.Surface(self.window_size, pygame.SRCALPHA)
+            flash_surf = self._scratch(self.window_size)
             alpha = int(self.gold_flash * 4)
             flash_surf.fill((255, 215, 0, min(alpha, 80)))
             self.screen.blit(flash_surf, (0, 0))
-            self.gold_flash -= 1
 
-        if self.agent.state in (GameState.DEAD_WUMPUS, GameState.DEAD_PIT):
+        if self.agent.state in _DEAD_STATES:
             self._draw_game_over()
         elif self.agent.state == GameState.WIN:
             self._draw_win_screen()
@@ -614,52 +1132,96 @@ class WumpusGUI:
         if self.show_help:
             self._draw_help_overlay()
 
-        pygame.display.flip()
+        # Present through update() on both paths; a full frame is one window
+        # rect, and so is a partial one once its rects add up to a large share
+        # of the window, where one big copy beats many small ones
+        shown = [self.screen.get_rect()]
+        if not full:
+            # Tiles are opaque, so the grid itself is presented but never restored
+            dirty = prev_rects + rects + panel_areas + [grid_rect]
+            if sum(r.w * r.h for r in dirty) <= w * h * DIRTY_AREA_LIMIT:
+                shown = dirty
+        pygame.display.update(shown)
+        self._dirty_rects = rects
+        self._full_redraw = shaking or overlay
+
+    def _panel_chrome(self):
+        """Static panel parts for the current layout, drawn once per percept-line count."""
+        lines = max(1, len(self.world.get_percepts(self.agent.pos)))
+        surf = self._panel_chrome_cache.get(lines)
+        if surf is None:
+            surf = pygame.Surface(self.window_size, pygame.SRCALPHA)
+            self._draw_panel(surf, chrome=True)
+            self._panel_chrome_cache[lines] = surf
+        return surf
 
-    def _draw_grid(self, sx, sy):
-        cs = self.cell_size
-        ox, oy = self.grid_origin()
+    def _button(self, size, label, btn_col):
+        """Rounded button face with its centred label, drawn once per size and colour."""
+        key = (size, label, btn_col)
+        surf = self._button_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            rect = surf.get_rect()
+            pygame.draw.rect(surf, btn_col, rect, border_radius=6)
+            pygame.draw.rect(surf, COL_GRID_LINE, rect, 1, border_radius=6)
+            txt = self._text(self.font_body, label, COL_BUTTON_TEXT)
+            surf.blit(txt, (rect.centerx - txt.get_width() // 2,
+                            rect.centery - txt.get_height() // 2))
+            self._button_cache[key] = surf
+        return surf
 
-        for r in range(self.world.size):
-            for c in range(self.world.size):
-                rect = self.cell_rect(r, c)
-                rect.x += sx
-                rect.y += sy
-                explored = (r, c) in self.agent.explored
+    def _panel_state(self):
+        """Everything the side panel shows; the panel layer is rebuilt when it changes."""
+        mouse_pos = self._mouse_pos
+        return (
+            self.window_size, self.agent.score, self.agent.pos, self.agent.facing,
+            self.agent.has_gold, self.agent.has_arrow, self.agent.state,
+            self.world.get_percept_mask(self.agent.pos), self.world_size,
+            self.btn_restart.collidepoint(mouse_pos), self.btn_help.collidepoint(mouse_pos),
+        )
 
-                if explored:
-                    draw_stone_tile(self.screen, (rect.x, rect.y, rect.w, rect.h))
-                    pygame.draw.rect(self.screen, COL_EXPLORED_BORDER, rect, 1)
-                else:
-                    draw_fog_tile(self.screen, (rect.x, rect.y, rect.w, rect.h), self.tick_count)
-                    pygame.draw.rect(self.screen, COL_GRID_LINE, rect, 1)
-
-                # Draw cell contents if explored
-                if explored:
-                    cell = self.world.cell_at(r, c)
-                    center_x = rect.x + cs // 2
-                    center_y = rect.y + cs // 2
-                    icon_size = cs * 2 // 3
-
-                    if cell == "W":
-                        draw_wumpus(self.screen, center_x, center_y, icon_size, self.tick_count)
-                    elif cell == "G":
-                        draw_gold(self.screen, center_x, center_y, icon_size, self.tick_count)
-                    elif cell == "P":
-                        draw_pit(self.screen, center_x, center_y, icon_size)
-                    elif cell == "A":
-                        draw_arrow_item(self.screen, center_x, center_y, icon_size)
-
-                    # Percept indicators in corners
-                    percepts = self.world.get_percepts((r, c))
-                    for pi, p in enumerate(percepts):
-                        corner_x = rect.x + cs - 14
-                        corner_y = rect.y + 10 + pi * 16
-                        draw_percept_icon(self.screen, corner_x, corner_y, cs, p, self.tick_count)
-
-                    # Dead wumpus marker
-                    if self.agent.killed_wumpus_pos == (r, c):
-                        draw_dead_wumpus(self.screen, center_x, center_y, icon_size, self.tick_count)
+    def _draw_grid(self, sx, sy):
+        """Draw the cave grid; returns (grid rect, rect of everything drawn incl. overhang)."""
+        cs = self.cell_size
+        grid_rect = self.grid_bounds().move(sx, sy)
+        # Percept halos poke out of edge cells by up to one icon size
+        pad = max(cs // 5, 6)
+        drawn = [grid_rect.inflate(pad * 2, pad * 2)]
+        layer, fog_cells, live = self._grid_layer(cs)
+        ox, oy = grid_rect.topleft
+        clip = self.screen.get_clip()
+
+        # Explored floor and static contents in one blit, then fog on top
+        self.screen.blit(layer, grid_rect)
+        fog = self._fog_tile(cs)
+        _blit_batch(self.screen, [(fog, (ox + x, oy + y)) for x, y in fog_cells
+                                  if clip.colliderect((ox + x, oy + y, cs, cs))])
+
+        # Animated contents and percepts, in the same per-cell order as the layer
+        phase = (self.tick_count // SPRITE_PHASE_TICKS) % SPRITE_PHASES
+        anim_tick = self.anim_tick
+        icon_size = cs * 2 // 3
+        for x, y, name, percepts, dead in live:
+            x += ox
+            y += oy
+            # Sprites may overhang their cell by up to a cell
+            if not clip.colliderect((x - cs, y - cs, cs * 3, cs * 3)):
+                continue
+            center_x = x + cs // 2
+            center_y = y + cs // 2
+            if name:
+                drawn.append(self._blit_sprite(name, center_x, center_y, icon_size,
+                                               phase if name in ANIMATED_SPRITES else 0))
+
+            # Percept indicators in corners
+            for pi, p in enumerate(percepts):
+                corner_x = x + cs - 14
+                corner_y = y + 10 + pi * 16
+                draw_percept_icon(self.screen, corner_x, corner_y, cs, p, anim_tick)
+
+            # Dead wumpus marker
+            if dead:
+                drawn.append(self._blit_sprite("dead_wumpus", center_x, center_y, icon_size))
 
         # Draw player on top
         pr = self.cell_rect(self.agent.pos[0], self.agent.pos[1])
@@ -667,13 +1229,12 @@ class WumpusGUI:
         pr.y += sy
         
         # Torch glow around player
-        glow_size = cs + int(abs(math.sin(self.tick_count * 0.08)) * 10)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*COL_TORCH_GLOW, 60), (glow_size, glow_size), glow_size)
-        self.screen.blit(glow_surf, (pr.x + cs//2 - glow_size, pr.y + cs//2 - glow_size))
+        glow_size = cs + int(abs(fsin(anim_tick * 0.08)) * 10)
+        drawn.append(self.screen.blit(_glow(glow_size, *COL_TORCH_GLOW, 60),
+                                      (pr.x + cs//2 - glow_size, pr.y + cs//2 - glow_size)))
         
-        draw_player(self.screen, pr.x + cs // 2, pr.y + cs // 2, cs * 2 // 3,
-                     self.agent.facing, self.tick_count)
+        drawn.append(self._blit_sprite("player", pr.x + cs // 2, pr.y + cs // 2, cs * 2 // 3,
+                                       phase, self.agent.facing))
 
         # Arrow trail animation
         if self.agent.arrow_anim_timer > 0 and self.agent.arrow_trail:
@@ -686,236 +1247,196 @@ class WumpusGUI:
                 arect.y += sy
                 arrow_cx = arect.x + cs // 2
                 arrow_cy = arect.y + cs // 2
-                glow_surf = pygame.Surface((cs, cs), pygame.SRCALPHA)
                 glow_alpha = max(30, 200 - i * 50)
-                pygame.draw.circle(glow_surf, (*COL_ARROW_PROJ, glow_alpha),
-                                   (cs // 2, cs // 2), cs // 4)
-                self.screen.blit(glow_surf, (arect.x, arect.y))
+                glow_r = cs // 4
+                self.screen.blit(_glow(glow_r, *COL_ARROW_PROJ, glow_alpha),
+                                 (arrow_cx - glow_r, arrow_cy - glow_r))
                 pygame.draw.circle(self.screen, COL_ARROW_PROJ, (arrow_cx, arrow_cy), 4)
 
-    def _draw_panel(self):
-        """Draw the HUD side panel."""
+        return grid_rect, grid_rect.unionall(drawn)
+
+    def _draw_panel(self, surface, chrome=False):
+        """Draw the HUD side panel onto surface (the panel layer).
+
+        With chrome=True only the parts that never change for a given layout
+        are drawn (titles, separators, slider track, idle buttons); otherwise
+        only the values that go on top of them. Both passes walk the same
+        layout, which shifts only with the number of percept lines.
+        """
         w, h = self.window_size
         px = self.panel_x + 15
         py = 20
+        percepts = self.world.get_percepts(self.agent.pos)
 
         # Title
-        title = self.font_title.render("⚔ Wumpus World", True, COL_TEXT)
-        self.screen.blit(title, (px, py))
+        if chrome:
+            title = self._text(self.font_title, "⚔ Wumpus World", COL_TEXT)
+            surface.blit(title, (px, py))
         py += 35
 
         # Separator
-        pygame.draw.line(self.screen, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
+        if chrome:
+            pygame.draw.line(surface, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
         py += 12
 
         # Score
-        score_txt = self.font_body.render(f"Score: {self.agent.score}", True, COL_TEXT_GOLD)
-        self.screen.blit(score_txt, (px, py))
+        if not chrome:
+            score_txt = self._text(self.font_body, f"Score: {self.agent.score}", COL_TEXT_GOLD)
+            surface.blit(score_txt, (px, py))
         py += 28
 
         # Position & Facing
-        pos_txt = self.font_small.render(
-            f"Position: ({self.agent.pos[0]}, {self.agent.pos[1]})  Facing: {self.agent.facing.value.upper()}",
-            True, COL_TEXT_DIM
-        )
-        self.screen.blit(pos_txt, (px, py))
+        if not chrome:
+            pos_txt = self._text(
+                self.font_small,
+                f"Position: ({self.agent.pos[0]}, {self.agent.pos[1]})  Facing: {self.agent.facing.name}",
+                COL_TEXT_DIM
+            )
+            surface.blit(pos_txt, (px, py))
         py += 24
 
         # Separator
-        pygame.draw.line(self.screen, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
+        if chrome:
+            pygame.draw.line(surface, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
         py += 12
 
         # Inventory
-        inv_title = self.font_body.render("Inventory", True, COL_TEXT)
-        self.screen.blit(inv_title, (px, py))
+        if chrome:
+            inv_title = self._text(self.font_body, "Inventory", COL_TEXT)
+            surface.blit(inv_title, (px, py))
         py += 22
-        gold_status = "✅ Gold" if self.agent.has_gold else "❌ Gold"
-        gold_col = COL_TEXT_GREEN if self.agent.has_gold else COL_TEXT_DIM
-        self.screen.blit(self.font_small.render(gold_status, True, gold_col), (px + 8, py))
+        if not chrome:
+            gold_status = "✅ Gold" if self.agent.has_gold else "❌ Gold"
+            gold_col = COL_TEXT_GREEN if self.agent.has_gold else COL_TEXT_DIM
+            surface.blit(self._text(self.font_small, gold_status, gold_col), (px + 8, py))
         py += 18
-        arrow_status = "✅ Arrow" if self.agent.has_arrow else "❌ Arrow"
-        arrow_col = COL_TEXT_GREEN if self.agent.has_arrow else COL_TEXT_DIM
-        self.screen.blit(self.font_small.render(arrow_status, True, arrow_col), (px + 8, py))
+        if not chrome:
+            arrow_status = "✅ Arrow" if self.agent.has_arrow else "❌ Arrow"
+            arrow_col = COL_TEXT_GREEN if self.agent.has_arrow else COL_TEXT_DIM
+            surface.blit(self._text(self.font_small, arrow_status, arrow_col), (px + 8, py))
         py += 24
 
         # Separator
-        pygame.draw.line(self.screen, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
+        if chrome:
+            pygame.draw.line(surface, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
         py += 12
 
         # Percepts
-        percepts_title = self.font_body.render("Percepts", True, COL_TEXT)
-        self.screen.blit(percepts_title, (px, py))
+        if chrome:
+            percepts_title = self._text(self.font_body, "Percepts", COL_TEXT)
+            surface.blit(percepts_title, (px, py))
         py += 22
-        percepts = self.world.get_percepts(self.agent.pos)
         if percepts:
             for p in percepts:
-                icon = {"Stench": "💨", "Breeze": "🌀", "Glitter": "✨"}.get(p, "")
-                col = {
-                    "Stench": COL_STENCH, "Breeze": COL_BREEZE, "Glitter": COL_GLITTER
-                }.get(p, COL_TEXT)
-                self.screen.blit(self.font_small.render(f"{icon} {p}", True, col), (px + 8, py))
+                if not chrome:
+                    icon = _PERCEPT_ICON.get(p, "")
+                    col = _PERCEPT_COL.get(p, COL_TEXT)
+                    surface.blit(self._text(self.font_small, f"{icon} {p}", col), (px + 8, py))
                 py += 18
         else:
-            self.screen.blit(self.font_small.render("  Nothing detected", True, COL_TEXT_DIM), (px + 8, py))
+            if not chrome:
+                surface.blit(self._text(self.font_small, "  Nothing detected", COL_TEXT_DIM), (px + 8, py))
             py += 18
         py += 14
 
         # Separator
-        pygame.draw.line(self.screen, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
+        if chrome:
+            pygame.draw.line(surface, COL_GRID_LINE, (px, py), (px + self.panel_w - 35, py))
         py += 12
 
         # World size slider
-        size_label = self.font_body.render(f"World Size: {self.world_size}×{self.world_size}", True, COL_TEXT)
-        self.screen.blit(size_label, (px, py))
+        if not chrome:
+            size_label = self._text(self.font_body, f"World Size: {self.world_size}×{self.world_size}", COL_TEXT)
+            surface.blit(size_label, (px, py))
         py += 24
         slider_w = self.panel_w - 50
         slider_x = px
         self.slider_rect = pygame.Rect(slider_x, py, slider_w, 12)
-        # Track
-        pygame.draw.rect(self.screen, COL_GRID_LINE, self.slider_rect, border_radius=6)
-        # Fill
-        t = (self.world_size - 4) / 4  # 4 to 8
-        fill_w = int(t * slider_w)
-        pygame.draw.rect(self.screen, COL_PLAYER_TUNIC, (slider_x, py, max(fill_w, 6), 12), border_radius=6)
-        # Knob
-        knob_x = slider_x + fill_w
-        pygame.draw.circle(self.screen, COL_TEXT, (knob_x, py + 6), 8)
-        pygame.draw.circle(self.screen, COL_PLAYER_TUNIC, (knob_x, py + 6), 6)
+        if chrome:
+            # Track
+            pygame.draw.rect(surface, COL_GRID_LINE, self.slider_rect, border_radius=6)
+        else:
+            # Fill
+            t = (self.world_size - 4) / 4  # 4 to 8
+            fill_w = int(t * slider_w)
+            pygame.draw.rect(surface, COL_PLAYER_TUNIC, (slider_x, py, max(fill_w, 6), 12), border_radius=6)
+            # Knob
+            knob_x = slider_x + fill_w
+            pygame.draw.circle(surface, COL_TEXT, (knob_x, py + 6), 8)
+            pygame.draw.circle(surface, COL_PLAYER_TUNIC, (knob_x, py + 6), 6)
         py += 28
 
-        # Restart button
+        # Buttons: drawn idle in the chrome, redrawn on top only when hovered
         btn_w, btn_h = self.panel_w - 50, 32
         self.btn_restart = pygame.Rect(px, py, btn_w, btn_h)
-        mouse_pos = pygame.mouse.get_pos()
-        btn_col = COL_BUTTON_HOVER if self.btn_restart.collidepoint(mouse_pos) else COL_BUTTON
-        pygame.draw.rect(self.screen, btn_col, self.btn_restart, border_radius=6)
-        pygame.draw.rect(self.screen, COL_GRID_LINE, self.btn_restart, 1, border_radius=6)
-        rtxt = self.font_body.render("🔄 Restart", True, COL_BUTTON_TEXT)
-        self.screen.blit(rtxt, (self.btn_restart.centerx - rtxt.get_width() // 2,
-                                self.btn_restart.centery - rtxt.get_height() // 2))
-        py += 42
-
-        # Help button
-        self.btn_help = pygame.Rect(px, py, btn_w, btn_h)
-        btn_col2 = COL_BUTTON_HOVER if self.btn_help.collidepoint(mouse_pos) else COL_BUTTON
-        pygame.draw.rect(self.screen, btn_col2, self.btn_help, border_radius=6)
-        pygame.draw.rect(self.screen, COL_GRID_LINE, self.btn_help, 1, border_radius=6)
-        htxt = self.font_body.render("❓ Help (H)", True, COL_BUTTON_TEXT)
-        self.screen.blit(htxt, (self.btn_help.centerx - htxt.get_width() // 2,
-                                self.btn_help.centery - htxt.get_height() // 2))
-        py += 50
+        self.btn_help = pygame.Rect(px, py + 42, btn_w, btn_h)
+        mouse_pos = self._mouse_pos
+        for rect, label in ((self.btn_restart, "🔄 Restart"), (self.btn_help, "❓ Help (H)")):
+            if chrome:
+                surface.blit(self._button(rect.size, label, COL_BUTTON), rect)
+            elif rect.collidepoint(mouse_pos):
+                surface.blit(self._button(rect.size, label, COL_BUTTON_HOVER), rect)
+        py += 42 + 50
 
         # Game status
-        state_labels = {
-            GameState.PLAYING: ("🎮 Playing...", COL_TEXT_DIM),
-            GameState.WIN: ("🏆 YOU WIN!", COL_TEXT_GOLD),
-            GameState.DEAD_WUMPUS: ("💀 Dead - Wumpus", COL_TEXT_RED),
-            GameState.DEAD_PIT: ("💀 Dead - Pit", COL_TEXT_RED),
-        }
-        label, col = state_labels[self.agent.state]
-        state_txt = self.font_body.render(label, True, col)
-        self.screen.blit(state_txt, (px, py))
+        if not chrome:
+            label, col = _STATE_LABELS[self.agent.state]
+            state_txt = self._text(self.font_body, label, col)
+            surface.blit(state_txt, (px, py))
 
     def _draw_message(self):
-        """Draw status message at bottom of grid area."""
+        """Draw status message at bottom of grid area; returns the rect it covers."""
         if self.agent.message_timer > 0 and self.agent.message:
-            msg_surf = self.font_msg.render(self.agent.message, True, COL_TEXT)
+            msg_surf, mw, mh = self._text_sized(self.font_msg, self.agent.message, COL_TEXT)
             w, h = self.window_size
-            mx = 10 + self.grid_area_w // 2 - msg_surf.get_width() // 2
+            mx = 10 + self.grid_area_w // 2 - mw // 2
             my = h - 40
             # Background
-            bg_rect = pygame.Rect(mx - 12, my - 6, msg_surf.get_width() + 24, msg_surf.get_height() + 12)
-            bg_surf = pygame.Surface((bg_rect.w, bg_rect.h), pygame.SRCALPHA)
-            bg_surf.fill((30, 30, 45, 200))
-            self.screen.blit(bg_surf, (bg_rect.x, bg_rect.y))
-            pygame.draw.rect(self.screen, COL_GRID_LINE, bg_rect, 1, border_radius=4)
+            bg_rect = pygame.Rect(mx - 12, my - 6, mw + 24, mh + 12)
+            self.screen.blit(self._msg_bg(bg_rect.size), bg_rect)
             self.screen.blit(msg_surf, (mx, my))
+            return bg_rect
+        return None
 
     def _draw_game_over(self):
         """Draw game-over overlay."""
         w, h = self.window_size
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay((w, h), (0, 0, 0, 150)), (0, 0))
 
         # Text
-        go_txt = self.font_large.render("GAME OVER", True, COL_TEXT_RED)
-        self.screen.blit(go_txt, (w // 2 - go_txt.get_width() // 2, h // 2 - 50))
-
+        self._blit_centered(self.font_large, "GAME OVER", COL_TEXT_RED, h // 2 - 50)
         reason = "Eaten by the Wumpus!" if self.agent.state == GameState.DEAD_WUMPUS else "Fell into a pit!"
-        r_txt = self.font_body.render(reason, True, COL_TEXT)
-        self.screen.blit(r_txt, (w // 2 - r_txt.get_width() // 2, h // 2))
-
-        restart_txt = self.font_body.render("Press R to restart", True, COL_TEXT_DIM)
-        self.screen.blit(restart_txt, (w // 2 - restart_txt.get_width() // 2, h // 2 + 35))
-
-        score_txt = self.font_body.render(f"Final Score: {self.agent.score}", True, COL_TEXT_GOLD)
-        self.screen.blit(score_txt, (w // 2 - score_txt.get_width() // 2, h // 2 + 60))
+        self._blit_centered(self.font_body, reason, COL_TEXT, h // 2)
+        self._blit_centered(self.font_body, "Press R to restart", COL_TEXT_DIM, h // 2 + 35)
+        self._blit_centered(self.font_body, f"Final Score: {self.agent.score}", COL_TEXT_GOLD, h // 2 + 60)
 
     def _draw_win_screen(self):
         """Draw win overlay."""
         w, h = self.window_size
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        glow = int(abs(math.sin(self.tick_count * 0.05)) * 40)
-        overlay.fill((0, 0, 0, 130))
-        self.screen.blit(overlay, (0, 0))
-
-        win_txt = self.font_large.render("🏆 YOU WIN! 🏆", True,
-                                          tuple(min(255, c + glow) for c in COL_WIN_GLOW))
-        self.screen.blit(win_txt, (w // 2 - win_txt.get_width() // 2, h // 2 - 50))
-
-        score_txt = self.font_body.render(f"Final Score: {self.agent.score}", True, COL_TEXT_GOLD)
-        self.screen.blit(score_txt, (w // 2 - score_txt.get_width() // 2, h // 2 + 10))
+        self.screen.blit(self._overlay((w, h), (0, 0, 0, 130)), (0, 0))
 
-        restart_txt = self.font_body.render("Press R to restart", True, COL_TEXT_DIM)
-        self.screen.blit(restart_txt, (w // 2 - restart_txt.get_width() // 2, h // 2 + 45))
+        self._blit_centered(self.font_large, "🏆 YOU WIN! 🏆",
+                            _WIN_GLOW[self.tick_count & (_WIN_GLOW_TICKS - 1)], h // 2 - 50)
+        self._blit_centered(self.font_body, f"Final Score: {self.agent.score}", COL_TEXT_GOLD, h // 2 + 10)
+        self._blit_centered(self.font_body, "Press R to restart", COL_TEXT_DIM, h // 2 + 45)
 
     def _draw_help_overlay(self):
         """Draw help/instructions overlay."""
+        if self._help_surface is None or self._help_size != self.window_size:
+            self._help_surface = self._build_help_overlay()
+            self._help_size = self.window_size
+        self.screen.blit(self._help_surface, (0, 0))
+
+    def _build_help_overlay(self):
+        """Dimmed backdrop with the instructions, composed once per window size."""
         w, h = self.window_size
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+        overlay = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
         overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
-
-        cx, cy = w // 2, 60
-        lines = [
-            ("🏰 Wumpus World – How to Play", self.font_title, COL_TEXT_GOLD),
-            ("", None, None),
-            ("Movement:", self.font_body, COL_TEXT),
-            ("  W / ↑  –  Move Up", self.font_small, COL_TEXT_DIM),
-            ("  A / ←  –  Move Left", self.font_small, COL_TEXT_DIM),
-            ("  S / ↓  –  Move Down", self.font_small, COL_TEXT_DIM),
-            ("  D / →  –  Move Right", self.font_small, COL_TEXT_DIM),
-            ("", None, None),
-            ("Actions:", self.font_body, COL_TEXT),
-            ("  Enter / Space  –  Shoot arrow (in facing direction)", self.font_small, COL_TEXT_DIM),
-            ("  R              –  Restart game", self.font_small, COL_TEXT_DIM),
-            ("  H              –  Toggle this help", self.font_small, COL_TEXT_DIM),
-            ("  F11            –  Toggle fullscreen", self.font_small, COL_TEXT_DIM),
-            ("", None, None),
-            ("Symbols:", self.font_body, COL_TEXT),
-            ("  👹 Wumpus – Deadly monster (kill with arrow)", self.font_small, COL_WUMPUS),
-            ("  ✨ Gold – Collect and return to start to win", self.font_small, COL_GOLD),
-            ("  🕳️ Pit – Instant death", self.font_small, COL_TEXT_RED),
-            ("  🏹 Arrow – Pickup to shoot or auto-defend vs Wumpus", self.font_small, COL_ARROW_ITEM),
-            ("", None, None),
-            ("Percepts (warning on adjacent cells):", self.font_body, COL_TEXT),
-            ("  💨 Stench – Wumpus nearby!", self.font_small, COL_STENCH),
-            ("  🌀 Breeze – Pit nearby!", self.font_small, COL_BREEZE),
-            ("  ✨ Glitter – Gold here!", self.font_small, COL_GLITTER),
-            ("", None, None),
-            ("Goal: Find the gold and return to start (bottom-left)!", self.font_body, COL_TEXT_GREEN),
-            ("", None, None),
-            ("Press H to close", self.font_small, COL_TEXT_DIM),
-        ]
-
-        for text, font, color in lines:
-            if font is None:
-                cy += 8
-                continue
-            surf = font.render(text, True, color)
-            self.screen.blit(surf, (cx - surf.get_width() // 2, cy))
-            cy += surf.get_height() + 4
+
+        cx = w // 2
+        overlay.blits([(surf, (cx - sw // 2, y)) for surf, sw, y in self._help_lines],
+                      doreturn=False)
+        return overlay
 
     # ─── Event Handling ──────────────────────────────────────────────────
     def handle_events(self):
@@ -925,23 +1446,16 @@ class WumpusGUI:
             
             if event.type == pygame.VIDEORESIZE:
                 self.bg_needs_update = True
+                self._flush_render_caches()
+
+            if event.type in _WINDOW_REDRAW_EVENTS:
+                self._full_redraw = True
 
             if event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_w, pygame.K_UP):
-                    self.agent.move(Direction.UP)
-                    if self.agent.state in (GameState.DEAD_WUMPUS, GameState.DEAD_PIT):
-                        self.screen_shake = 20
-                elif event.key in (pygame.K_s, pygame.K_DOWN):
-                    self.agent.move(Direction.DOWN)
-                    if self.agent.state in (GameState.DEAD_WUMPUS, GameState.DEAD_PIT):
-                        self.screen_shake = 20
-                elif event.key in (pygame.K_a, pygame.K_LEFT):
-                    self.agent.move(Direction.LEFT)
-                    if self.agent.state in (GameState.DEAD_WUMPUS, GameState.DEAD_PIT):
-                        self.screen_shake = 20
-                elif event.key in (pygame.K_d, pygame.K_RIGHT):
-                    self.agent.move(Direction.RIGHT)
-                    if self.agent.state in (GameState.DEAD_WUMPUS, GameState.DEAD_PIT):
+                direction = MOVE_KEYS.get(event.key)
+                if direction is not None:
+                    self.agent.move(direction)
+                    if self.agent.state in _DEAD_STATES:
                         self.screen_shake = 20
                 elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                     self.agent.shoot()
@@ -970,8 +1484,11 @@ class WumpusGUI:
                     self.dragging_slider = True
                     self._update_slider(event.pos[0])
 
-            if event.type == pygame.MOUSEBUTTONUP:
+            if event.type == pygame.MOUSEBUTTONUP and self.dragging_slider:
                 self.dragging_slider = False
+                # The new world is built once, when the drag ends
+                if self.world_size != self.world.size:
+                    self.restart()
 
             if event.type == pygame.MOUSEMOTION and self.dragging_slider:
                 self._update_slider(event.pos[0])
@@ -979,7 +1496,7 @@ class WumpusGUI:
         return True
 
     def _update_slider(self, mouse_x):
-        """Update world size from slider position."""
+        """Update the chosen world size from slider position; applied on release."""
         t = (mouse_x - self.slider_rect.x) / max(self.slider_rect.w, 1)
         t = max(0.0, min(1.0, t))
         new_size = int(4 + t * 4)
@@ -987,17 +1504,34 @@ class WumpusGUI:
         if new_size != self.world_size:
             self.world_size = new_size
             self.num_pits = max(1, new_size - 1)
-            self.restart()
 
     # ─── Main Loop ───────────────────────────────────────────────────────
     async def run(self):
         running = True
         while running:
             running = self.handle_events()
-            self.agent.tick()
-            self.draw() # Draw everything
-            self.tick_count += 1
-            self.clock.tick(FPS)
+            # Help and end screens barely move, so they are drawn at IDLE_FPS;
+            # timers, dust and the animation clock take the skipped frames'
+            # steps so messages, sprites and the win glow keep their real
+            # speed. Shake and flash keep the loop at FPS while they run,
+            # and count down here too, so they also end in a hidden window.
+            idle = ((self.show_help or self.agent.state != GameState.PLAYING)
+                    and not self.screen_shake and not self.gold_flash)
+            fps = IDLE_FPS if idle else FPS
+            steps = FPS // fps
+            for _ in range(steps):
+                self.agent.tick()
+                self._update_particles()
+                if self.screen_shake > 0:
+                    self.screen_shake -= 1
+                if self.gold_flash > 0:
+                    self.gold_flash -= 1
+            # The cave always animates, so there is no idle frame to skip;
+            # a hidden or minimised window is the one case with nothing to show
+            if not _SKIP_HIDDEN_FRAMES or pygame.display.get_active():
+                self.draw() # Draw everything
+            self.tick_count += steps
+            self.clock.tick(fps)
             await asyncio.sleep(0)  # Very important for web build!
 
         pygame.quit()